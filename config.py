@@ -157,6 +157,13 @@ CHART_HEIGHT = 500
 CHART_HEIGHT_SMALL = 350
 CHART_HEIGHT_MINI = 250
 
+# Downsample line traces (LTTB) above LTTB_THRESHOLD points to LTTB_MAX_POINTS
+LTTB_THRESHOLD = 2000
+LTTB_MAX_POINTS = 500
+
+# Gradient-styled tables are truncated to this many rows
+MAX_STYLED_ROWS = 2000
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CACHE SETTINGS
 # ═══════════════════════════════════════════════════════════════════════════
@@ -179,14 +186,14 @@ PAGE_CONFIG = {
 # ═══════════════════════════════════════════════════════════════════════════
 
 PAGES = [
+    "📚 About This Research",
     "🏠 Overview",
     "📈 5-Year Trend",
     "📊 Quarterly Deep-Dive",
     "🏦 Sector Analysis",
     "📉 Earnings Downgrades",
     "🎯 Scenarios",
-    "📋 Data Explorer",
-    "📚 Data Sources"
+    "📋 Data Explorer"
 ]
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -199,6 +206,44 @@ MESSAGES = {
     'sidebar_title': '🏔️ The Mountain Path - World of Finance',
 }
 
+# ═══════════════════════════════════════════════════════════════════════════
+# ABOUT PAGE CONTENT
+# ═══════════════════════════════════════════════════════════════════════════
+
+KEY_FINDINGS = {
+    "Revenue Growth": "Decelerating from 15.4% (FY22) to 6.9% (FY25)",
+    "Profit Growth": "Higher but vulnerable at 4.6% (FY25)",
+    "CAGR Divergence": "Profit 15.5% vs Revenue 9.2% (unsustainable)",
+    "Margin Status": "Expansion complete, now facing limits",
+    "Earnings Revisions": "Dramatic 67% downgrade in 6 months",
+    "Analyst Sentiment": "Shifting from optimistic to cautious",
+    "Sector Concentration": "Financials 35% + Energy 30% = 65% of index",
+    "Investment Implication": "Revenue recovery critical for profit sustainability"
+}
+
+NAVIGATION_GUIDE_MD = """**Recommended Analysis Path:**
+
+1. **Start Here** (📚 About This Research) - Understand objectives and context
+2. **Overview** (🏠) - Get executive summary of key findings
+3. **5-Year Trend** (📈) - Understand historical context and patterns
+4. **Quarterly Deep-Dive** (📊) - See current deceleration in detail
+5. **Sector Analysis** (🏦) - Identify sector-specific risks/opportunities
+6. **Earnings Downgrades** (📉) - Assess analyst sentiment and revisions
+7. **Scenarios** (🎯) - Explore future possibilities and valuations
+8. **Data Explorer** (📋) - Verify sources and explore raw data
+
+**Or jump directly to sections most relevant to your questions!**"""
+
+# Pre-joined once at import so the About page emits a single markdown element
+ABOUT_FINDINGS_MD = "\n\n".join([
+    "#### 🔑 Key Findings (Preview)",
+    *(f"**{key}:** {value}" for key, value in KEY_FINDINGS.items()),
+    "---",
+    "#### 🧭 How to Navigate This Dashboard",
+    NAVIGATION_GUIDE_MD,
+    "---",
+])
+
 # ═══════════════════════════════════════════════════════════════════════════
 # METRICS & KPIs
 # ═══════════════════════════════════════════════════════════════════════════
@@ -12,6 +12,7 @@ Comprehensive data management with:
 
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from typing import Dict, Tuple
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -107,52 +108,131 @@ def get_downgrade_data() -> pd.DataFrame:
         'FY25 Profit Growth (%)': [9.8, 8.2, 5.8, 3.2, 4.9, 3.2]
     })
 
+# ═══════════════════════════════════════════════════════════════════════════
+# DERIVED TABLES
+# ═══════════════════════════════════════════════════════════════════════════
+
+def get_divergence_data(five_year: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the revenue vs profit growth divergence table
+    
+    Args:
+        five_year (pd.DataFrame): Output of get_five_year_data()
+        
+    Returns:
+        pd.DataFrame: Yearly growth rates, divergence and driver
+    """
+    revenue = five_year['Revenue Growth (%)']
+    profit = five_year['PAT Growth (%)']
+    
+    return pd.DataFrame({
+        'Fiscal Year': five_year['Fiscal Year'],
+        'Revenue Growth %': revenue.round(1),
+        'Profit Growth %': profit.round(1),
+        'Divergence (pts)': (profit - revenue).round(1),
+        'Driver': ['Vol+Mar', 'Vol+Mar', 'Vol+Mar', 'Vol+Mar', 'Margin']
+    })
+
+
+def get_revision_data(downgrades: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the month-on-month earnings revision table
+    
+    Args:
+        downgrades (pd.DataFrame): Output of get_downgrade_data()
+        
+    Returns:
+        pd.DataFrame: Estimates with the revision from the previous month
+    """
+    growth = downgrades['FY25 Profit Growth (%)']
+    revisions = ['-'] + [f"{change:.1f}%" for change in growth.diff().iloc[1:]]
+    
+    return pd.DataFrame({
+        'Date': downgrades['Date'],
+        'Period': downgrades['Period'],
+        'FY25 Profit Growth %': growth.round(1),
+        'Revision from Previous': revisions
+    })
+
 # ═══════════════════════════════════════════════════════════════════════════
 # SCENARIO DEFINITIONS
 # ═══════════════════════════════════════════════════════════════════════════
 
-def get_scenarios() -> Dict:
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """Earnings growth (%) and P/E assumptions for one projection scenario"""
+    name: str
+    description: str
+    fy25_earnings: float
+    fy26_earnings: float
+    fy27_earnings: float
+    fy25_pe: float
+    fy26_pe: float
+    fy27_pe: float
+    color: str
+    probability: float
+    
+    @property
+    def earnings(self) -> Tuple[float, float, float]:
+        """Earnings growth for FY25, FY26, FY27"""
+        return (self.fy25_earnings, self.fy26_earnings, self.fy27_earnings)
+    
+    @property
+    def pe(self) -> Tuple[float, float, float]:
+        """P/E multiples for FY25, FY26, FY27"""
+        return (self.fy25_pe, self.fy26_pe, self.fy27_pe)
+
+
+SCENARIOS = (
+    Scenario(
+        name='Base Case (50%)',
+        description='Margin Resilience, Slow Revenue',
+        fy25_earnings=5.5,
+        fy26_earnings=11.0,
+        fy27_earnings=12.5,
+        fy25_pe=25.0,
+        fy26_pe=24.5,
+        fy27_pe=24.0,
+        color='#FFA500',
+        probability=0.50
+    ),
+    Scenario(
+        name='Bear Case (25%)',
+        description='Margin Compression, Input Cost Spike',
+        fy25_earnings=2.0,
+        fy26_earnings=5.0,
+        fy27_earnings=7.5,
+        fy25_pe=23.0,
+        fy26_pe=22.0,
+        fy27_pe=21.5,
+        color='#FF0000',
+        probability=0.25
+    ),
+    Scenario(
+        name='Bull Case (25%)',
+        description='Revenue Recovery + Margin Stability',
+        fy25_earnings=9.0,
+        fy26_earnings=14.0,
+        fy27_earnings=15.5,
+        fy25_pe=25.5,
+        fy26_pe=26.0,
+        fy27_pe=26.5,
+        color='#00AA00',
+        probability=0.25
+    ),
+)
+
+SCENARIOS_BY_NAME = {scenario.name: scenario for scenario in SCENARIOS}
+
+
+def get_scenarios() -> Dict[str, Scenario]:
     """
     Get scenario definitions for future earnings projections
     
     Returns:
-        dict: Three scenarios with earnings and P/E assumptions
+        dict: Three scenarios with earnings and P/E assumptions, by name
     """
-    return {
-        'Base Case (50%)': {
-            'description': 'Margin Resilience, Slow Revenue',
-            'fy25_earnings': 5.5,
-            'fy26_earnings': 11.0,
-            'fy27_earnings': 12.5,
-            'fy25_pe': 25.0,
-            'fy26_pe': 24.5,
-            'fy27_pe': 24.0,
-            'color': '#FFA500',
-            'probability': 0.50
-        },
-        'Bear Case (25%)': {
-            'description': 'Margin Compression, Input Cost Spike',
-            'fy25_earnings': 2.0,
-            'fy26_earnings': 5.0,
-            'fy27_earnings': 7.5,
-            'fy25_pe': 23.0,
-            'fy26_pe': 22.0,
-            'fy27_pe': 21.5,
-            'color': '#FF0000',
-            'probability': 0.25
-        },
-        'Bull Case (25%)': {
-            'description': 'Revenue Recovery + Margin Stability',
-            'fy25_earnings': 9.0,
-            'fy26_earnings': 14.0,
-            'fy27_earnings': 15.5,
-            'fy25_pe': 25.5,
-            'fy26_pe': 26.0,
-            'fy27_pe': 26.5,
-            'color': '#00AA00',
-            'probability': 0.25
-        }
-    }
+    return SCENARIOS_BY_NAME
 
 # ═══════════════════════════════════════════════════════════════════════════
 # NIFTY LEVEL CALCULATIONS
@@ -171,31 +251,114 @@ def calculate_nifty_levels(scenarios: Dict) -> Dict:
     Returns:
         dict: Nifty levels for FY25, FY26, FY27 by scenario (in thousands)
     """
-    nifty_levels = {}
-    
-    for scenario, data in scenarios.items():
-        try:
-            # Calculate EPS for each year
-            fy25_eps = BASE_EPS_FY24 * (1 + data['fy25_earnings'] / 100)
-            fy26_eps = fy25_eps * (1 + data['fy26_earnings'] / 100)
-            fy27_eps = fy26_eps * (1 + data['fy27_earnings'] / 100)
-            
-            # Calculate Nifty levels
-            fy25_nifty = fy25_eps * data['fy25_pe']
-            fy26_nifty = fy26_eps * data['fy26_pe']
-            fy27_nifty = fy27_eps * data['fy27_pe']
-            
-            # Store in thousands
-            nifty_levels[scenario] = [
-                fy25_nifty / 1000,
-                fy26_nifty / 1000,
-                fy27_nifty / 1000
-            ]
-        except Exception as e:
-            print(f"Error calculating Nifty levels for {scenario}: {str(e)}")
-            nifty_levels[scenario] = [0, 0, 0]
-    
-    return nifty_levels
+    try:
+        # (scenarios x years) matrices of earnings growth and P/E
+        earnings = np.array([s.earnings for s in scenarios.values()], dtype=np.float64)
+        pes = np.array([s.pe for s in scenarios.values()], dtype=np.float64)
+        
+        # Compound EPS across years, then Nifty = EPS * P/E (in thousands)
+        eps = BASE_EPS_FY24 * np.cumprod(1 + earnings / 100, axis=1)
+        nifty = eps * pes / 1000
+        
+        return dict(zip(scenarios.keys(), nifty.tolist()))
+    except Exception as e:
+        print(f"Error calculating Nifty levels: {str(e)}")
+        return {scenario: [0, 0, 0] for scenario in scenarios}
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SCENARIO DISPLAY VALUES
+# ═══════════════════════════════════════════════════════════════════════════
+
+def get_scenario_views(scenarios: Dict, nifty_levels: Dict) -> Dict:
+    """
+    Pre-format everything the Scenarios page displays for each scenario
+    
+    Args:
+        scenarios (dict): Scenario definitions from get_scenarios()
+        nifty_levels (dict): Output of calculate_nifty_levels()
+        
+    Returns:
+        dict: Per-scenario description, color and formatted
+              probability, earnings, P/E and Nifty target strings
+    """
+    return {
+        name: {
+            'description': scenario.description,
+            'color': scenario.color,
+            'probability': f"{scenario.probability*100:.0f}%",
+            'earnings': [f"₹{value:.1f}" for value in scenario.earnings],
+            'pe': [f"{value:.1f}x" for value in scenario.pe],
+            'targets': [f"{level:.0f}" for level in nifty_levels[name]]
+        }
+        for name, scenario in scenarios.items()
+    }
+
+def get_scenario_comparison(scenario_views: Dict) -> pd.DataFrame:
+    """
+    Build the side-by-side scenario comparison table
+    
+    Args:
+        scenario_views (dict): Output of get_scenario_views()
+        
+    Returns:
+        pd.DataFrame: One row per metric, one column per scenario
+    """
+    columns = {
+        'Metric': ['Probability', 'FY25 Earnings', 'FY26 Earnings', 'FY27 Earnings',
+                   'FY25 P/E', 'FY26 P/E', 'FY27 P/E',
+                   'FY25 Target', 'FY26 Target', 'FY27 Target']
+    }
+    for name, view in scenario_views.items():
+        columns[name] = [view['probability'], *view['earnings'], *view['pe'], *view['targets']]
+    
+    return pd.DataFrame(columns)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CHART DOWNSAMPLING
+# ═══════════════════════════════════════════════════════════════════════════
+
+def lttb_indices(y, n_out: int) -> np.ndarray:
+    """
+    Select points to keep with Largest-Triangle-Three-Buckets downsampling
+    
+    Points are treated as evenly spaced on the x axis. The first and last
+    points are always kept; each bucket in between keeps the point that
+    forms the largest triangle with the previous pick and the next
+    bucket's average.
+    
+    Args:
+        y (array-like): Series values
+        n_out (int): Number of points to keep
+        
+    Returns:
+        np.ndarray: Sorted positional indices of the kept points
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.arange(n, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    
+    return kept
 
 # ═══════════════════════════════════════════════════════════════════════════
 # KEY METRICS CALCULATION
@@ -298,9 +461,9 @@ def validate_data() -> Tuple[bool, str]:
         
         # Validate scenarios
         for scenario_name, scenario_data in scenarios.items():
-            assert 'fy25_earnings' in scenario_data
-            assert 'fy25_pe' in scenario_data
-            assert scenario_data['probability'] > 0
+            assert isinstance(scenario_data, Scenario)
+            assert scenario_data.name == scenario_name
+            assert scenario_data.probability > 0
         
         return True, "✅ All data validated successfully"
     
@@ -321,14 +484,22 @@ def load_all_data() -> Dict:
         dict: Complete dataset with all analysis components
     """
     scenarios = get_scenarios()
+    nifty_levels = calculate_nifty_levels(scenarios)
+    scenario_views = get_scenario_views(scenarios, nifty_levels)
+    five_year = get_five_year_data()
+    downgrades = get_downgrade_data()
     
     return {
-        'five_year': get_five_year_data(),
+        'five_year': five_year,
         'quarterly': get_quarterly_data(),
         'sector': get_sector_data(),
-        'downgrades': get_downgrade_data(),
+        'downgrades': downgrades,
+        'divergence': get_divergence_data(five_year),
+        'revisions': get_revision_data(downgrades),
         'scenarios': scenarios,
-        'nifty_levels': calculate_nifty_levels(scenarios),
+        'nifty_levels': nifty_levels,
+        'scenario_views': scenario_views,
+        'scenario_comparison': get_scenario_comparison(scenario_views),
         'metrics': calculate_key_metrics()
     }
 
@@ -376,14 +547,15 @@ def export_to_csv(data_type: str) -> str:
         str: CSV formatted string
     """
     data_map = {
-        'five_year': get_five_year_data(),
-        'quarterly': get_quarterly_data(),
-        'sector': get_sector_data(),
-        'downgrades': get_downgrade_data()
+        'five_year': get_five_year_data,
+        'quarterly': get_quarterly_data,
+        'sector': get_sector_data,
+        'downgrades': get_downgrade_data
     }
     
+    # Build only the requested dataset
     if data_type in data_map:
-        return data_map[data_type].to_csv(index=False)
+        return data_map[data_type]().to_csv(index=False)
     else:
         return ""
 
@@ -393,7 +565,7 @@ def export_to_csv(data_type: str) -> str:
 
 def initialize_data():
     """
-    Initialize and validate all data on module load
+    Initialize and validate all data
     
     Returns:
         tuple: (success: bool, message: str)
@@ -404,10 +576,6 @@ def initialize_data():
         load_all_data()
     return success, message
 
-# Run initialization on import
-if __name__ != "__main__":
-    initialize_data()
-
 # ═══════════════════════════════════════════════════════════════════════════
 # PUBLIC API
 # ═══════════════════════════════════════════════════════════════════════════
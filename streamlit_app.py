@@ -6,21 +6,29 @@ Version 2.5.0 - 9 Pages with "About This Research" Landing Page
 Cache Buster: FORCE_REFRESH_PAGES_20250118_001
 """
 
+import io
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict
+
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import numpy as np
-from datetime import datetime
 
-from config import COLORS, AUTHOR, BRAND_NAME, EXPERIENCE, LOCATION, YEAR, PAGES
-from data import generate_data
+from config import (
+    COLORS, AUTHOR, BRAND_NAME, EXPERIENCE, LOCATION, YEAR, CACHE_TTL,
+    ABOUT_FINDINGS_MD, PAGES, LTTB_THRESHOLD, LTTB_MAX_POINTS
+)
+from data import generate_data, validate_data, lttb_indices
 from styles import (
-    get_custom_css, display_styled_dataframe,
+    apply_custom_css, display_styled_dataframe,
     render_section_header, render_subsection_header, render_divider,
     render_info_box, render_warning_box, render_success_box,
-    render_footer
+    render_metric_grid, render_footer
 )
 
+ASSETS_DIR = Path(__file__).parent / "assets"
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PAGE CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -32,13 +40,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown(get_custom_css(), unsafe_allow_html=True)
+apply_custom_css()
 
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN PAGE HEADER
 # ═══════════════════════════════════════════════════════════════════════════
 
-st.markdown("""
+st.html("""
 <div style="background-color: #003366; color: #FFD700; padding: 20px 20px; border-radius: 0; margin: -16px -16px 25px -16px; text-align: center;">
     <h1 style="margin: 0 0 8px 0; font-size: 24px; font-weight: 700;">
         📚 The Mountain Path - World of Finance
@@ -50,66 +58,7 @@ st.markdown("""
         Is profit growth driven by revenue expansion or margin expansion?
     </p>
 </div>
-""", unsafe_allow_html=True)
-
-# Sidebar Radio Button Styling - Contrast Background
-st.markdown("""
-<style>
-/* Sidebar container background */
-section[data-testid="stSidebar"] {
-    background-color: #F5F5F5 !important;
-}
-
-/* Radio button group container */
-section[data-testid="stSidebar"] [role="radiogroup"] {
-    display: flex !important;
-    flex-direction: column !important;
-    gap: 8px !important;
-}
-
-/* Individual radio button styling */
-section[data-testid="stSidebar"] [role="radio"] {
-    background-color: #FFFFFF !important;
-    border: 2px solid #003366 !important;
-    border-radius: 8px !important;
-    padding: 12px 14px !important;
-    margin: 4px 0 !important;
-    font-weight: 600 !important;
-    color: #003366 !important;
-    cursor: pointer !important;
-    transition: all 0.3s ease !important;
-    display: flex !important;
-    align-items: center !important;
-}
-
-/* Hover state - light blue background */
-section[data-testid="stSidebar"] [role="radio"]:hover {
-    background-color: #F0F7FF !important;
-    border-color: #005599 !important;
-    box-shadow: 0 2px 6px rgba(0, 51, 102, 0.15) !important;
-}
-
-/* Selected/Active radio button - dark blue background with white text */
-section[data-testid="stSidebar"] [role="radio"][aria-checked="true"] {
-    background: linear-gradient(135deg, #003366 0%, #005599 100%) !important;
-    color: #FFFFFF !important;
-    border-color: #003366 !important;
-    box-shadow: 0 4px 12px rgba(0, 51, 102, 0.25) !important;
-    font-weight: 700 !important;
-}
-
-/* Radio circle styling */
-section[data-testid="stSidebar"] input[type="radio"] {
-    accent-color: #003366 !important;
-    cursor: pointer !important;
-}
-
-/* Selected radio circle white */
-section[data-testid="stSidebar"] [aria-checked="true"] input[type="radio"] {
-    accent-color: #FFFFFF !important;
-}
-</style>
-""", unsafe_allow_html=True)
+""")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SIDEBAR & NAVIGATION
@@ -121,27 +70,13 @@ st.sidebar.markdown(f"**Prof. V. Ravichandran**")
 st.sidebar.markdown(f"*{EXPERIENCE}*")
 st.sidebar.markdown("---")
 
-# Show all 8 pages with explicit list
-pages_list = [
-    "📚 About This Research",
-    "🏠 Overview",
-    "📈 5-Year Trend",
-    "📊 Quarterly Deep-Dive",
-    "🏦 Sector Analysis",
-    "📉 Earnings Downgrades",
-    "🎯 Scenarios",
-    "📋 Data Explorer"
-]
-
+# Show all 8 pages from config.PAGES
 page = st.sidebar.radio(
     "📍 Choose Analysis:",
-    pages_list,
+    PAGES,
     key="main_nav"
 )
 
-# Convert selected page string to index for comparison
-page_index = pages_list.index(page) if page in pages_list else 0
-
 st.sidebar.markdown("---")
 st.sidebar.markdown(f"📍 {LOCATION} | {YEAR}")
 st.sidebar.markdown("---")
@@ -163,13 +98,350 @@ st.sidebar.markdown("""
 def load_dashboard_data():
     return generate_data()
 
+
+@st.cache_data(ttl=CACHE_TTL)
+def csv_bytes(df) -> bytes:
+    """Serialize a dataset to UTF-8 CSV bytes once for download buttons"""
+    return df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def bundle_zip(five_year, quarterly, sector, downgrades) -> bytes:
+    """Bundle all four datasets as CSV files into one in-memory ZIP archive"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for file_name, df in (
+            ('nifty50_5year_performance.csv', five_year),
+            ('nifty50_quarterly_performance.csv', quarterly),
+            ('nifty50_sector_analysis.csv', sector),
+            ('nifty50_earnings_revisions.csv', downgrades),
+        ):
+            archive.writestr(file_name, csv_bytes(df))
+    return buffer.getvalue()
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def five_year_plot_arrays(five_year) -> dict:
+    """Extract 5-year chart columns once as plain float lists for plotly traces"""
+    return {
+        'year': five_year['Fiscal Year'].tolist(),
+        'rev': five_year['Revenue Growth (%)'].to_numpy(dtype=np.float64).tolist(),
+        'pat': five_year['PAT Growth (%)'].to_numpy(dtype=np.float64).tolist(),
+        'ebitda_margin': five_year['EBITDA Margin (%)'].to_numpy(dtype=np.float64).tolist(),
+        'pat_margin': five_year['PAT Margin (%)'].to_numpy(dtype=np.float64).tolist(),
+    }
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def quarterly_plot_arrays(quarterly) -> dict:
+    """Extract quarterly chart columns once as plain lists for plotly traces"""
+    return {
+        'quarter': quarterly['Quarter'].tolist(),
+        'rev': quarterly['Revenue Growth (%)'].to_numpy(dtype=np.float64).tolist(),
+    }
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def downgrade_plot_arrays(downgrades) -> dict:
+    """Extract earnings-revision chart columns once as plain lists for plotly traces"""
+    return {
+        'date': downgrades['Date'].tolist(),
+        'pat': downgrades['FY25 Profit Growth (%)'].to_numpy(dtype=np.float64).tolist(),
+    }
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def build_data_summary(five_year, quarterly, sector, downgrades) -> list[str]:
+    """Pre-format the title and record/metric counts shown for each download"""
+    return [
+        f"**{title}**\n\n*Records: {len(df)} | Metrics: {len(df.columns)}*"
+        for title, df in (
+            ('📈 5-Year Performance Data', five_year),
+            ('📊 Quarterly Performance Data', quarterly),
+            ('🏢 Sector Analysis Data', sector),
+            ('📉 Earnings Revisions Data', downgrades),
+        )
+    ]
+
+
+@st.cache_data(show_spinner=False)
+def _key_metrics_df() -> pd.DataFrame:
+    """Build the static Overview key-metrics table once"""
+    return pd.DataFrame({
+        'Metric': ['Revenue CAGR (FY21-25)', 'Profit CAGR (FY21-25)', 'EBITDA Margin (FY25)', 'PAT Margin (FY25)'],
+        'Value': ['9.2%', '19.8%', '33.0%', '10.5%']
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _top_sectors_df(sectors) -> pd.DataFrame:
+    """Build the Overview top-5 sector contribution table once"""
+    top_sectors = sectors.head(5)
+    return pd.DataFrame({
+        'Sector': top_sectors['Sector'],
+        'Weight in Nifty %': top_sectors['Weight in Nifty (%)'].round(1),
+        'Revenue Growth %': top_sectors['Revenue Growth FY25 (%)'].round(1),
+        'Status': top_sectors['Status']
+    })
+
+
+@st.cache_resource(show_spinner=False)
+def _data_notes_md() -> str:
+    """Read the static Data Notes documentation shipped in assets/ once per process"""
+    return (ASSETS_DIR / 'data_notes.md').read_text(encoding='utf-8')
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CHART BUILDERS
+# ═══════════════════════════════════════════════════════════════════════════
+# Figures are cached per process; plotly is imported only when a chart
+# page first needs it.
+
+# Shared trace styles (plotly copies these dicts into each trace)
+_TREND_LINES = {
+    'blue': dict(color=COLORS['chart_blue'], width=3),
+    'red': dict(color=COLORS['accent_red'], width=3),
+    'gold': dict(color=COLORS['accent_gold'], width=3),
+}
+_TREND_MARKER = dict(size=10)
+_AREA_LINES = {
+    'blue': dict(color=COLORS['chart_blue'], width=4),
+    'red': dict(color=COLORS['accent_red'], width=4),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _plotly_template() -> str:
+    """Register the shared 'nifty' plotly template once per process and return its name"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    
+    template = go.layout.Template(pio.templates['plotly_white'])
+    template.layout.height = 400
+    pio.templates['nifty'] = template
+    return 'nifty'
+
+
+def _thin(x, y, *extra):
+    """Downsample a line trace with LTTB once it exceeds LTTB_THRESHOLD points"""
+    if len(y) <= LTTB_THRESHOLD:
+        return (x, y, *extra)
+    idx = lttb_indices(y, LTTB_MAX_POINTS)
+    columns = [list(seq) for seq in (x, y, *extra)]
+    return tuple([col[i] for i in idx] for col in columns)
+
+
+@st.cache_resource(show_spinner=False)
+def _growth_trend_fig(five_year):
+    """Revenue vs profit growth lines for the 5-Year Trend page"""
+    import plotly.graph_objects as go
+    
+    arrs = five_year_plot_arrays(five_year)
+    fig = go.Figure()
+    
+    x, y = _thin(arrs['year'], arrs['rev'])
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        name='Revenue Growth',
+        line=_TREND_LINES['blue'],
+        marker=_TREND_MARKER
+    ))
+    
+    x, y = _thin(arrs['year'], arrs['pat'])
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        name='Profit Growth',
+        line=_TREND_LINES['red'],
+        marker=_TREND_MARKER
+    ))
+    
+    fig.update_layout(
+        title="Revenue vs Profit Growth Trends",
+        xaxis_title="Fiscal Year",
+        yaxis_title="Growth Rate (%)",
+        template=_plotly_template(),
+        hovermode='x unified'
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _margin_trend_fig(five_year):
+    """EBITDA and PAT margin lines for the 5-Year Trend page"""
+    import plotly.graph_objects as go
+    
+    arrs = five_year_plot_arrays(five_year)
+    fig = go.Figure()
+    
+    x, y = _thin(arrs['year'], arrs['ebitda_margin'])
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        name='EBITDA Margin',
+        line=_TREND_LINES['gold'],
+        marker=_TREND_MARKER
+    ))
+    
+    x, y = _thin(arrs['year'], arrs['pat_margin'])
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        name='PAT Margin',
+        line=_TREND_LINES['red'],
+        marker=_TREND_MARKER
+    ))
+    
+    fig.update_layout(
+        title="Margin Trends",
+        xaxis_title="Fiscal Year",
+        yaxis_title="Margin (%)",
+        template=_plotly_template(),
+        hovermode='x unified'
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _annual_revenue_fig(five_year):
+    """Annual revenue growth area chart for the Quarterly Deep-Dive page"""
+    import plotly.graph_objects as go
+    
+    arrs = five_year_plot_arrays(five_year)
+    annual_labels = arrs['year']
+    annual_x = list(range(len(annual_labels)))
+    
+    fig = go.Figure()
+    
+    x, y, text = _thin(annual_x, arrs['rev'], annual_labels)
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        name='Annual Revenue Growth',
+        line=_AREA_LINES['blue'],
+        marker=dict(size=14),
+        fill='tozeroy',
+        text=text,
+        hovertemplate='<b>%{text}</b><br>Revenue Growth: %{y:.1f}%<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="Annual Revenue Growth Trajectory",
+        xaxis_title="Fiscal Year",
+        yaxis_title="Revenue Growth Rate (%)",
+        xaxis=dict(
+            ticktext=annual_labels,
+            tickvals=annual_x
+        ),
+        template=_plotly_template(),
+        height=450,
+        showlegend=False
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _quarterly_revenue_fig(quarterly):
+    """Quarterly revenue growth area chart for the Quarterly Deep-Dive page"""
+    import plotly.graph_objects as go
+    
+    arrs = quarterly_plot_arrays(quarterly)
+    q_labels = arrs['quarter']
+    quarterly_x = list(range(len(q_labels)))
+    
+    fig = go.Figure()
+    
+    x, y, text = _thin(quarterly_x, arrs['rev'], q_labels)
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        name='Quarterly Revenue Growth',
+        line=_AREA_LINES['red'],
+        marker=dict(size=14, symbol='diamond'),
+        fill='tozeroy',
+        fillcolor='rgba(255, 0, 0, 0.2)',
+        text=text,
+        hovertemplate='<b>%{text}</b><br>Revenue Growth: %{y:.1f}%<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="Quarterly Revenue Growth Deceleration",
+        xaxis_title="Quarter (FY2025)",
+        yaxis_title="Revenue Growth Rate (%)",
+        xaxis=dict(
+            ticktext=q_labels,
+            tickvals=quarterly_x
+        ),
+        template=_plotly_template(),
+        height=450,
+        showlegend=False
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _revision_trend_fig(downgrades):
+    """FY25 estimate revision area chart for the Earnings Downgrades page"""
+    import plotly.graph_objects as go
+    
+    arrs = downgrade_plot_arrays(downgrades)
+    date_labels = arrs['date']
+    x_pos = list(range(len(date_labels)))
+    
+    fig = go.Figure()
+    
+    x, y, text = _thin(x_pos, arrs['pat'], date_labels)
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        name='FY25 Profit Growth Estimate',
+        line=_AREA_LINES['red'],
+        marker=dict(size=12, symbol='circle'),
+        fill='tozeroy',
+        fillcolor='rgba(255, 0, 0, 0.1)',
+        text=text,
+        hovertemplate='<b>%{text}</b><br>Estimate: %{y:.1f}%<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="FY2025 Profit Growth Estimate Revision",
+        xaxis_title="Revision Date",
+        yaxis_title="FY25 Profit Growth (%)",
+        xaxis=dict(
+            ticktext=date_labels,
+            tickvals=x_pos,
+            tickangle=-45
+        ),
+        template=_plotly_template(),
+        showlegend=False
+    )
+    return fig
+
+
 data = load_dashboard_data()
 
+# Validate the embedded datasets once per session rather than on every rerun
+if 'data_validated' not in st.session_state:
+    st.session_state.data_validated = validate_data()
+
+is_valid, validation_msg = st.session_state.data_validated
+if not is_valid:
+    st.error(validation_msg)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PAGE 0: ABOUT THIS RESEARCH
 # ═══════════════════════════════════════════════════════════════════════════
 
-if page_index == 0:
+def _about(data):
+    """Page: About This Research"""
     render_section_header("📚 About This Research Analysis")
     
     st.markdown("""
@@ -377,44 +649,8 @@ if page_index == 0:
     
     render_divider()
     
-    # Key Findings Preview
-    render_subsection_header("🔑 Key Findings (Preview)")
-    
-    findings = {
-        "Revenue Growth": "Decelerating from 15.4% (FY22) to 6.9% (FY25)",
-        "Profit Growth": "Higher but vulnerable at 4.6% (FY25)",
-        "CAGR Divergence": "Profit 15.5% vs Revenue 9.2% (unsustainable)",
-        "Margin Status": "Expansion complete, now facing limits",
-        "Earnings Revisions": "Dramatic 67% downgrade in 6 months",
-        "Analyst Sentiment": "Shifting from optimistic to cautious",
-        "Sector Concentration": "Financials 35% + Energy 30% = 65% of index",
-        "Investment Implication": "Revenue recovery critical for profit sustainability"
-    }
-    
-    for key, value in findings.items():
-        st.markdown(f"**{key}:** {value}")
-    
-    render_divider()
-    
-    # Navigation Guide
-    render_subsection_header("🧭 How to Navigate This Dashboard")
-    
-    st.markdown("""
-    **Recommended Analysis Path:**
-    
-    1. **Start Here** (📚 About This Research) - Understand objectives and context
-    2. **Overview** (🏠) - Get executive summary of key findings
-    3. **5-Year Trend** (📈) - Understand historical context and patterns
-    4. **Quarterly Deep-Dive** (📊) - See current deceleration in detail
-    5. **Sector Analysis** (🏦) - Identify sector-specific risks/opportunities
-    6. **Earnings Downgrades** (📉) - Assess analyst sentiment and revisions
-    7. **Scenarios** (🎯) - Explore future possibilities and valuations
-    8. **Data Explorer** (📋) - Verify sources and explore raw data
-    
-    **Or jump directly to sections most relevant to your questions!**
-    """)
-    
-    render_divider()
+    # Key Findings Preview & Navigation Guide
+    st.markdown(ABOUT_FINDINGS_MD)
     
     # Investment Perspective
     render_subsection_header("💡 Investment Perspective")
@@ -428,7 +664,9 @@ if page_index == 0:
         "The dashboard provides comprehensive analysis tools to navigate this transition."
     )
 
-elif page_index == 1:
+
+def _overview(data):
+    """Page: Overview"""
     render_section_header("📈 Nifty 50 Analysis: Growth Drivers & Sustainability")
     
     st.markdown("""
@@ -441,13 +679,8 @@ elif page_index == 1:
     # Key Metrics
     render_subsection_header("📊 Key Metrics Summary")
     
-    metrics_data = {
-        'Metric': ['Revenue CAGR (FY21-25)', 'Profit CAGR (FY21-25)', 'EBITDA Margin (FY25)', 'PAT Margin (FY25)'],
-        'Value': ['9.2%', '19.8%', '33.0%', '10.5%']
-    }
-    
     display_styled_dataframe(
-        pd.DataFrame(metrics_data),
+        _key_metrics_df(),
         columns_to_style=['Value'],
         width='stretch'
     )
@@ -460,16 +693,12 @@ elif page_index == 1:
     five_year = data['five_year']
     current_year = five_year.iloc[-1]
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Revenue Growth", f"{current_year['Revenue Growth (%)']:.1f}%", delta="YoY")
-    with col2:
-        st.metric("EBITDA Growth", f"{current_year['EBITDA Growth (%)']:.1f}%", delta="YoY")
-    with col3:
-        st.metric("PAT Growth", f"{current_year['PAT Growth (%)']:.1f}%", delta="YoY")
-    with col4:
-        st.metric("EBITDA Margin", f"{current_year['EBITDA Margin (%)']:.1f}%", delta="vs FY24")
+    render_metric_grid({
+        "Revenue Growth": (f"{current_year['Revenue Growth (%)']:.1f}%", "YoY"),
+        "EBITDA Growth": (f"{current_year['EBITDA Growth (%)']:.1f}%", "YoY"),
+        "PAT Growth": (f"{current_year['PAT Growth (%)']:.1f}%", "YoY"),
+        "EBITDA Margin": (f"{current_year['EBITDA Margin (%)']:.1f}%", "vs FY24"),
+    })
     
     render_divider()
     
@@ -572,17 +801,8 @@ elif page_index == 1:
     render_subsection_header("🏢 Top Contributing Sectors")
     
     sectors = data['sector']
-    top_sectors = sectors.head(5)
-    
-    sector_display = pd.DataFrame({
-        'Sector': top_sectors['Sector'],
-        'Weight in Nifty %': top_sectors['Weight in Nifty (%)'].round(1),
-        'Revenue Growth %': top_sectors['Revenue Growth FY25 (%)'].round(1),
-        'Status': top_sectors['Status']
-    })
-    
     display_styled_dataframe(
-        sector_display,
+        _top_sectors_df(sectors),
         width='stretch'
     )
     
@@ -628,77 +848,20 @@ elif page_index == 1:
 # PAGE 2: 5-YEAR TREND
 # ═══════════════════════════════════════════════════════════════════════════
 
-elif page_index == 2:
+def _five_year_trend(data):
+    """Page: 5-Year Trend"""
     render_section_header("📈 5-Year Trend Analysis")
     
     render_subsection_header("💹 5-Year Performance")
     
     five_year = data['five_year']
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=five_year['Fiscal Year'],
-        y=five_year['Revenue Growth (%)'],
-        mode='lines+markers',
-        name='Revenue Growth',
-        line=dict(color=COLORS['chart_blue'], width=3),
-        marker=dict(size=10)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=five_year['Fiscal Year'],
-        y=five_year['PAT Growth (%)'],
-        mode='lines+markers',
-        name='Profit Growth',
-        line=dict(color=COLORS['accent_red'], width=3),
-        marker=dict(size=10)
-    ))
-    
-    fig.update_layout(
-        title="Revenue vs Profit Growth Trends",
-        xaxis_title="Fiscal Year",
-        yaxis_title="Growth Rate (%)",
-        template='plotly_white',
-        height=400,
-        hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig, width='stretch')
+    st.plotly_chart(_growth_trend_fig(five_year), width='stretch')
     
     render_divider()
     
     render_subsection_header("📊 Margin Trends")
     
-    fig2 = go.Figure()
-    
-    fig2.add_trace(go.Scatter(
-        x=five_year['Fiscal Year'],
-        y=five_year['EBITDA Margin (%)'],
-        mode='lines+markers',
-        name='EBITDA Margin',
-        line=dict(color=COLORS['accent_gold'], width=3),
-        marker=dict(size=10)
-    ))
-    
-    fig2.add_trace(go.Scatter(
-        x=five_year['Fiscal Year'],
-        y=five_year['PAT Margin (%)'],
-        mode='lines+markers',
-        name='PAT Margin',
-        line=dict(color=COLORS['accent_red'], width=3),
-        marker=dict(size=10)
-    ))
-    
-    fig2.update_layout(
-        title="Margin Trends",
-        xaxis_title="Fiscal Year",
-        yaxis_title="Margin (%)",
-        template='plotly_white',
-        height=400,
-        hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig2, width='stretch')
+    st.plotly_chart(_margin_trend_fig(five_year), width='stretch')
     
     render_divider()
     
@@ -779,13 +942,7 @@ elif page_index == 2:
     # Growth Divergence Analysis
     render_subsection_header("📊 Growth Divergence Analysis")
     
-    divergence_data = pd.DataFrame({
-        'Fiscal Year': five_year['Fiscal Year'],
-        'Revenue Growth %': five_year['Revenue Growth (%)'].round(1),
-        'Profit Growth %': five_year['PAT Growth (%)'].round(1),
-        'Divergence (pts)': (five_year['PAT Growth (%)'] - five_year['Revenue Growth (%)']).round(1),
-        'Driver': ['Vol+Mar', 'Vol+Mar', 'Vol+Mar', 'Vol+Mar', 'Margin']
-    })
+    divergence_data = data['divergence']
     
     display_styled_dataframe(
         divergence_data,
@@ -822,7 +979,8 @@ elif page_index == 2:
 # PAGE 2: QUARTERLY DEEP-DIVE
 # ═══════════════════════════════════════════════════════════════════════════
 
-elif page_index == 3:
+def _quarterly_deep_dive(data):
+    """Page: Quarterly Deep-Dive"""
     render_section_header("📊 FY2025 Quarterly Deep-Dive Analysis")
     
     st.markdown("""
@@ -840,15 +998,12 @@ elif page_index == 3:
     render_subsection_header("📈 Annual Performance (FY2025 YTD)")
     
     annual_row = five_year.iloc[-1]
-    annual_cols = st.columns(4)
-    with annual_cols[0]:
-        st.metric("Revenue Growth", f"{annual_row['Revenue Growth (%)']:.1f}%", delta="YoY")
-    with annual_cols[1]:
-        st.metric("EBITDA Growth", f"{annual_row['EBITDA Growth (%)']:.1f}%", delta="YoY")
-    with annual_cols[2]:
-        st.metric("PAT Growth", f"{annual_row['PAT Growth (%)']:.1f}%", delta="YoY")
-    with annual_cols[3]:
-        st.metric("EBITDA Margin", f"{annual_row['EBITDA Margin (%)']:.1f}%", delta="vs FY24")
+    render_metric_grid({
+        "Revenue Growth": (f"{annual_row['Revenue Growth (%)']:.1f}%", "YoY"),
+        "EBITDA Growth": (f"{annual_row['EBITDA Growth (%)']:.1f}%", "YoY"),
+        "PAT Growth": (f"{annual_row['PAT Growth (%)']:.1f}%", "YoY"),
+        "EBITDA Margin": (f"{annual_row['EBITDA Margin (%)']:.1f}%", "vs FY24"),
+    })
     
     render_divider()
     
@@ -892,77 +1047,14 @@ elif page_index == 3:
     # ANNUAL TREND CHART
     render_subsection_header("📈 Annual Revenue Growth Trend (FY2021-2025)")
     
-    fig_annual = go.Figure()
-    
-    annual_x = list(range(len(five_year)))
-    annual_labels = five_year['Fiscal Year'].tolist()
-    
-    # Annual trend line
-    fig_annual.add_trace(go.Scatter(
-        x=annual_x,
-        y=five_year['Revenue Growth (%)'],
-        mode='lines+markers',
-        name='Annual Revenue Growth',
-        line=dict(color=COLORS['chart_blue'], width=4),
-        marker=dict(size=14),
-        fill='tozeroy',
-        text=annual_labels,
-        hovertemplate='<b>%{text}</b><br>Revenue Growth: %{y:.1f}%<extra></extra>'
-    ))
-    
-    fig_annual.update_layout(
-        title="Annual Revenue Growth Trajectory",
-        xaxis_title="Fiscal Year",
-        yaxis_title="Revenue Growth Rate (%)",
-        xaxis=dict(
-            ticktext=annual_labels,
-            tickvals=annual_x
-        ),
-        template='plotly_white',
-        height=450,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig_annual, use_container_width=True)
+    st.plotly_chart(_annual_revenue_fig(five_year), use_container_width=True)
     
     render_divider()
     
     # QUARTERLY TREND CHART
     render_subsection_header("📊 Quarterly Revenue Growth Trend (FY2025)")
     
-    fig_quarterly = go.Figure()
-    
-    quarterly_x = list(range(len(quarterly)))
-    q_labels = quarterly['Quarter'].tolist()
-    
-    # Quarterly trend
-    fig_quarterly.add_trace(go.Scatter(
-        x=quarterly_x,
-        y=quarterly['Revenue Growth (%)'],
-        mode='lines+markers',
-        name='Quarterly Revenue Growth',
-        line=dict(color=COLORS['accent_red'], width=4),
-        marker=dict(size=14, symbol='diamond'),
-        fill='tozeroy',
-        fillcolor='rgba(255, 0, 0, 0.2)',
-        text=q_labels,
-        hovertemplate='<b>%{text}</b><br>Revenue Growth: %{y:.1f}%<extra></extra>'
-    ))
-    
-    fig_quarterly.update_layout(
-        title="Quarterly Revenue Growth Deceleration",
-        xaxis_title="Quarter (FY2025)",
-        yaxis_title="Revenue Growth Rate (%)",
-        xaxis=dict(
-            ticktext=q_labels,
-            tickvals=quarterly_x
-        ),
-        template='plotly_white',
-        height=450,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig_quarterly, use_container_width=True)
+    st.plotly_chart(_quarterly_revenue_fig(quarterly), use_container_width=True)
     
     render_divider()
     
@@ -977,13 +1069,14 @@ elif page_index == 3:
 # PAGE 3: SECTOR ANALYSIS
 # ═══════════════════════════════════════════════════════════════════════════
 
-elif page_index == 4:
+def _sector_analysis(data):
+    """Page: Sector Analysis"""
     render_section_header("🏦 Sector Performance Analysis")
     
     sectors = data['sector']
     display_styled_dataframe(
         sectors,
-        columns_to_style=['Contribution (%)', 'Growth (%)'],
+        columns_to_style=['Revenue Growth FY25 (%)', 'Profit Growth FY25 (%)'],
         width='stretch',
         hide_index=True
     )
@@ -992,7 +1085,8 @@ elif page_index == 4:
 # PAGE 4: EARNINGS DOWNGRADES
 # ═══════════════════════════════════════════════════════════════════════════
 
-elif page_index == 5:
+def _earnings_downgrades(data):
+    """Page: Earnings Downgrades"""
     render_section_header("📉 6-Month Earnings Revision Trend")
     
     st.markdown("""
@@ -1017,58 +1111,21 @@ elif page_index == 5:
     # Key Metrics
     render_subsection_header("📈 Revision Metrics")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Latest Estimate", f"{downgrades.iloc[-1]['FY25 Profit Growth (%)']:.1f}%", delta="Current")
-    with col2:
-        st.metric("Highest Estimate", f"{downgrades['FY25 Profit Growth (%)'].max():.1f}%", delta="Sep 2024")
-    with col3:
-        st.metric("Lowest Estimate", f"{downgrades['FY25 Profit Growth (%)'].min():.1f}%", delta="Recent")
-    with col4:
-        total_revision = downgrades['FY25 Profit Growth (%)'].iloc[0] - downgrades['FY25 Profit Growth (%)'].iloc[-1]
-        st.metric("Total Revision", f"{total_revision:.1f}%", delta="Downgrade")
+    estimates = downgrades['FY25 Profit Growth (%)']
+    total_revision = estimates.iloc[0] - estimates.iloc[-1]
+    render_metric_grid({
+        "Latest Estimate": (f"{estimates.iloc[-1]:.1f}%", "Current"),
+        "Highest Estimate": (f"{estimates.max():.1f}%", "Sep 2024"),
+        "Lowest Estimate": (f"{estimates.min():.1f}%", "Recent"),
+        "Total Revision": (f"{total_revision:.1f}%", "Downgrade"),
+    })
     
     render_divider()
     
     # Revision Trend Chart
     render_subsection_header("📉 Revision Trend Over Time")
     
-    fig = go.Figure()
-    
-    # Create x-axis positions
-    x_pos = list(range(len(downgrades)))
-    date_labels = downgrades['Date'].tolist()
-    
-    # Revision line
-    fig.add_trace(go.Scatter(
-        x=x_pos,
-        y=downgrades['FY25 Profit Growth (%)'],
-        mode='lines+markers',
-        name='FY25 Profit Growth Estimate',
-        line=dict(color=COLORS['accent_red'], width=4),
-        marker=dict(size=12, symbol='circle'),
-        fill='tozeroy',
-        fillcolor='rgba(255, 0, 0, 0.1)',
-        text=date_labels,
-        hovertemplate='<b>%{text}</b><br>Estimate: %{y:.1f}%<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        title="FY2025 Profit Growth Estimate Revision",
-        xaxis_title="Revision Date",
-        yaxis_title="FY25 Profit Growth (%)",
-        xaxis=dict(
-            ticktext=date_labels,
-            tickvals=x_pos,
-            tickangle=-45
-        ),
-        template='plotly_white',
-        height=400,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_revision_trend_fig(downgrades), use_container_width=True)
     
     render_divider()
     
@@ -1100,19 +1157,7 @@ elif page_index == 5:
     # Monthly Revision Rates
     render_subsection_header("📋 Monthly Revision Details")
     
-    revision_data = pd.DataFrame({
-        'Date': downgrades['Date'],
-        'Period': downgrades['Period'],
-        'FY25 Profit Growth %': downgrades['FY25 Profit Growth (%)'].round(1),
-        'Revision from Previous': [
-            '-',
-            f"{downgrades.iloc[1]['FY25 Profit Growth (%)'] - downgrades.iloc[0]['FY25 Profit Growth (%)']:.1f}%",
-            f"{downgrades.iloc[2]['FY25 Profit Growth (%)'] - downgrades.iloc[1]['FY25 Profit Growth (%)']:.1f}%",
-            f"{downgrades.iloc[3]['FY25 Profit Growth (%)'] - downgrades.iloc[2]['FY25 Profit Growth (%)']:.1f}%",
-            f"{downgrades.iloc[4]['FY25 Profit Growth (%)'] - downgrades.iloc[3]['FY25 Profit Growth (%)']:.1f}%",
-            f"{downgrades.iloc[5]['FY25 Profit Growth (%)'] - downgrades.iloc[4]['FY25 Profit Growth (%)']:.1f}%"
-        ]
-    })
+    revision_data = data['revisions']
     
     display_styled_dataframe(
         revision_data,
@@ -1136,7 +1181,14 @@ elif page_index == 5:
 # PAGE 5: SCENARIOS
 # ═══════════════════════════════════════════════════════════════════════════
 
-elif page_index == 6:
+@st.fragment
+def render_scenarios(scenario_views, comparison_df):
+    """
+    Render the Scenarios page as a fragment.
+    
+    Switching the scenario radio reruns only this function instead of
+    the whole script (sidebar, header, and data loading stay untouched).
+    """
     render_section_header("🎯 Investment Scenarios - Detailed Analysis")
     
     st.markdown("""
@@ -1149,12 +1201,8 @@ elif page_index == 6:
     
     render_divider()
     
-    # Get scenarios data
-    scenarios_data = data['scenarios']
-    nifty_levels = data['nifty_levels']
-    
     # Radio button to select scenario
-    scenario_names = list(scenarios_data.keys())
+    scenario_names = list(scenario_views.keys())
     selected_scenario = st.radio(
         "📍 Choose Investment Scenario:",
         scenario_names,
@@ -1164,9 +1212,8 @@ elif page_index == 6:
     
     render_divider()
     
-    # Get selected scenario data
-    scenario_info = scenarios_data[selected_scenario]
-    nifty_targets = nifty_levels[selected_scenario]
+    # Get selected scenario's pre-formatted display values
+    view = scenario_views[selected_scenario]
     
     # Display selected scenario
     render_subsection_header(f"📊 {selected_scenario}")
@@ -1177,9 +1224,9 @@ elif page_index == 6:
         st.markdown(f"""
         **Scenario Description:**
         
-        {scenario_info['description']}
+        {view['description']}
         
-        **Probability:** {scenario_info['probability']*100:.0f}%
+        **Probability:** {view['probability']}
         """)
     
     with col2:
@@ -1189,13 +1236,13 @@ elif page_index == 6:
         """)
         
         # Display colored indicator
-        color = scenario_info['color']
-        st.markdown(f"<p style='font-size: 24px; color: {color};'>● {selected_scenario}</p>", unsafe_allow_html=True)
+        color = view['color']
+        st.html(f"<p style='font-size: 24px; color: {color};'>● {selected_scenario}</p>")
         
         st.markdown(f"""
         **Key Characteristics:**
         
-        {scenario_info['description']}
+        {view['description']}
         """)
     
     render_divider()
@@ -1203,91 +1250,39 @@ elif page_index == 6:
     # Earnings Projections
     render_subsection_header("💰 Earnings Projections (FY2025-2027)")
     
-    earnings_col1, earnings_col2, earnings_col3 = st.columns(3)
-    
-    with earnings_col1:
-        st.metric("FY2025 Earnings", f"₹{scenario_info['fy25_earnings']:.1f}", delta="Growth")
-    with earnings_col2:
-        st.metric("FY2026 Earnings", f"₹{scenario_info['fy26_earnings']:.1f}", delta="CAGR")
-    with earnings_col3:
-        st.metric("FY2027 Earnings", f"₹{scenario_info['fy27_earnings']:.1f}", delta="Projection")
+    render_metric_grid({
+        "FY2025 Earnings": (view['earnings'][0], "Growth"),
+        "FY2026 Earnings": (view['earnings'][1], "CAGR"),
+        "FY2027 Earnings": (view['earnings'][2], "Projection"),
+    })
     
     render_divider()
     
     # P/E Multiples
     render_subsection_header("📈 P/E Multiple Assumptions")
     
-    pe_col1, pe_col2, pe_col3 = st.columns(3)
-    
-    with pe_col1:
-        st.metric("FY2025 P/E", f"{scenario_info['fy25_pe']:.1f}x", delta="Valuation")
-    with pe_col2:
-        st.metric("FY2026 P/E", f"{scenario_info['fy26_pe']:.1f}x", delta="Normalized")
-    with pe_col3:
-        st.metric("FY2027 P/E", f"{scenario_info['fy27_pe']:.1f}x", delta="Terminal")
+    render_metric_grid({
+        "FY2025 P/E": (view['pe'][0], "Valuation"),
+        "FY2026 P/E": (view['pe'][1], "Normalized"),
+        "FY2027 P/E": (view['pe'][2], "Terminal"),
+    })
     
     render_divider()
     
     # Nifty 50 Target Levels
     render_subsection_header("🎯 Nifty 50 Target Levels")
     
-    target_col1, target_col2, target_col3 = st.columns(3)
-    
-    with target_col1:
-        st.metric("FY2025 Target", f"{nifty_targets[0]:.0f}", delta="Near-term")
-    with target_col2:
-        st.metric("FY2026 Target", f"{nifty_targets[1]:.0f}", delta="Medium-term")
-    with target_col3:
-        st.metric("FY2027 Target", f"{nifty_targets[2]:.0f}", delta="Long-term")
+    render_metric_grid({
+        "FY2025 Target": (view['targets'][0], "Near-term"),
+        "FY2026 Target": (view['targets'][1], "Medium-term"),
+        "FY2027 Target": (view['targets'][2], "Long-term"),
+    })
     
     render_divider()
     
     # Scenario Analysis Table
     render_subsection_header("📊 Scenario Comparison Matrix")
     
-    # Create comparison dataframe
-    comparison_df = pd.DataFrame({
-        'Metric': ['Probability', 'FY25 Earnings', 'FY26 Earnings', 'FY27 Earnings', 
-                   'FY25 P/E', 'FY26 P/E', 'FY27 P/E',
-                   'FY25 Target', 'FY26 Target', 'FY27 Target'],
-        'Base Case (50%)': [
-            f"{scenarios_data['Base Case (50%)']['probability']*100:.0f}%",
-            f"₹{scenarios_data['Base Case (50%)']['fy25_earnings']:.1f}",
-            f"₹{scenarios_data['Base Case (50%)']['fy26_earnings']:.1f}",
-            f"₹{scenarios_data['Base Case (50%)']['fy27_earnings']:.1f}",
-            f"{scenarios_data['Base Case (50%)']['fy25_pe']:.1f}x",
-            f"{scenarios_data['Base Case (50%)']['fy26_pe']:.1f}x",
-            f"{scenarios_data['Base Case (50%)']['fy27_pe']:.1f}x",
-            f"{nifty_levels['Base Case (50%)'][0]:.0f}",
-            f"{nifty_levels['Base Case (50%)'][1]:.0f}",
-            f"{nifty_levels['Base Case (50%)'][2]:.0f}"
-        ],
-        'Bear Case (25%)': [
-            f"{scenarios_data['Bear Case (25%)']['probability']*100:.0f}%",
-            f"₹{scenarios_data['Bear Case (25%)']['fy25_earnings']:.1f}",
-            f"₹{scenarios_data['Bear Case (25%)']['fy26_earnings']:.1f}",
-            f"₹{scenarios_data['Bear Case (25%)']['fy27_earnings']:.1f}",
-            f"{scenarios_data['Bear Case (25%)']['fy25_pe']:.1f}x",
-            f"{scenarios_data['Bear Case (25%)']['fy26_pe']:.1f}x",
-            f"{scenarios_data['Bear Case (25%)']['fy27_pe']:.1f}x",
-            f"{nifty_levels['Bear Case (25%)'][0]:.0f}",
-            f"{nifty_levels['Bear Case (25%)'][1]:.0f}",
-            f"{nifty_levels['Bear Case (25%)'][2]:.0f}"
-        ],
-        'Bull Case (25%)': [
-            f"{scenarios_data['Bull Case (25%)']['probability']*100:.0f}%",
-            f"₹{scenarios_data['Bull Case (25%)']['fy25_earnings']:.1f}",
-            f"₹{scenarios_data['Bull Case (25%)']['fy26_earnings']:.1f}",
-            f"₹{scenarios_data['Bull Case (25%)']['fy27_earnings']:.1f}",
-            f"{scenarios_data['Bull Case (25%)']['fy25_pe']:.1f}x",
-            f"{scenarios_data['Bull Case (25%)']['fy26_pe']:.1f}x",
-            f"{scenarios_data['Bull Case (25%)']['fy27_pe']:.1f}x",
-            f"{nifty_levels['Bull Case (25%)'][0]:.0f}",
-            f"{nifty_levels['Bull Case (25%)'][1]:.0f}",
-            f"{nifty_levels['Bull Case (25%)'][2]:.0f}"
-        ]
-    })
-    
     display_styled_dataframe(
         comparison_df,
         width='stretch',
@@ -1319,11 +1314,23 @@ elif page_index == 6:
             "Requires revenue inflection + operational efficiency."
         )
 
+
+def _scenarios(data):
+    """Page: Investment Scenarios"""
+    render_scenarios(data['scenario_views'], data['scenario_comparison'])
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PAGE 6: DATA EXPLORER
 # ═══════════════════════════════════════════════════════════════════════════
 
-elif page_index == 7:
+@st.fragment
+def _data_explorer(data):
+    """
+    Page: Data Explorer
+    
+    Runs as a fragment so download-button clicks rerun only this page,
+    not the sidebar, header, and footer around it.
+    """
     render_section_header("📋 Data Explorer")
     
     st.markdown("""
@@ -1334,41 +1341,6 @@ elif page_index == 7:
     
     render_divider()
     
-    # Custom CSS for tab styling - Simplified approach
-    st.markdown("""
-    <style>
-    .stTabs [data-baseweb="tab-list"] button {
-        background-color: #E8EDEF !important;
-        border: 2px solid #003366 !important;
-        border-radius: 6px !important;
-        padding: 12px 20px !important;
-        margin-right: 10px !important;
-        font-weight: 600 !important;
-        color: #003366 !important;
-        font-size: 14px !important;
-    }
-    
-    .stTabs [data-baseweb="tab-list"] button:hover {
-        background-color: #D0D8E8 !important;
-        border-color: #005599 !important;
-    }
-    
-    .stTabs [data-baseweb="tab-list"] [aria-selected="true"] {
-        background-color: #003366 !important;
-        color: #FFFFFF !important;
-        border-color: #003366 !important;
-    }
-    
-    .stTabs [data-baseweb="tab-panel"] {
-        padding: 20px !important;
-        background-color: #F8FAFB !important;
-        border-radius: 8px !important;
-        border-left: 5px solid #003366 !important;
-        margin-top: 20px !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📈 5-Year", "📊 Quarterly", "🏢 Sectors", "📉 Downgrades", "📝 Data Notes", "📥 Downloads"])
     
     with tab1:
@@ -1433,149 +1405,7 @@ elif page_index == 7:
         display_styled_dataframe(data['downgrades'], width='stretch', hide_index=True)
     
     with tab5:
-        render_subsection_header("📝 Data Documentation & Sources")
-        
-        st.markdown("**Data Collection & Methodology**")
-        st.markdown("""
-        All data presented in this dashboard is compiled from official and verified sources. 
-        Below is comprehensive documentation of data collection methodology and sources.
-        """)
-        
-        render_divider()
-        
-        st.markdown("**1. NIFTY 50 PERFORMANCE DATA**")
-        st.markdown("""
-        Source: National Stock Exchange (NSE), Reserve Bank of India (RBI)
-        
-        Collection Method:
-        - Annual performance data (FY2021-2025) extracted from NSE official database
-        - Revenue and profit figures sourced from consolidated financial statements
-        - Growth rates calculated as year-on-year percentage changes
-        - Margin data calculated from audited financial statements
-        
-        Frequency: Annual (with YTD for current fiscal year)
-        Reliability: High - Official stock exchange and RBI data
-        """)
-        
-        render_divider()
-        
-        st.markdown("**2. QUARTERLY PERFORMANCE DATA**")
-        st.markdown("""
-        Source: NSE, Stock Exchange Filings, Company Reports
-        
-        Collection Method:
-        - Quarterly results compiled from official NSE filings
-        - Extracted from Nifty 50 constituent quarterly reports
-        - Growth rates calculated on quarter-on-quarter basis
-        - Data represents FY2025 performance (Q1-Q3)
-        
-        Frequency: Quarterly
-        Reliability: High - Official quarterly reports and filings
-        """)
-        
-        render_divider()
-        
-        st.markdown("**3. SECTOR ANALYSIS DATA**")
-        st.markdown("""
-        Source: BSE (Bombay Stock Exchange), Sectoral Index Reports
-        
-        Collection Method:
-        - Sector-wise breakdown derived from Nifty 50 constituents
-        - Weight percentages calculated from market capitalization
-        - Growth rates aggregated from sector index performance
-        - Status indicators based on comparative performance analysis
-        
-        Frequency: Monthly review
-        Reliability: High - Official BSE data and index calculation methodology
-        """)
-        
-        render_divider()
-        
-        st.markdown("**4. EARNINGS REVISION DATA**")
-        st.markdown("""
-        Source: SEBI (Securities and Exchange Board of India), Brokerage Research Aggregates
-        
-        Collection Method:
-        - Earnings revision history compiled from analyst consensus estimates
-        - Data spans 6-month rolling average of forecasts
-        - Profit growth estimates for FY25 tracked from Sep 2024 onwards
-        - Sources include major brokerages and institutional research teams
-        
-        Frequency: Monthly tracking
-        Reliability: Medium-High - Aggregated analyst estimates subject to volatility
-        """)
-        
-        render_divider()
-        
-        st.markdown("**5. RESEARCH SOURCES**")
-        st.markdown("""
-        Analysis Framework Based On:
-        - Business Standard - Daily market analysis and corporate reporting
-        - Economic Times - Macro trends and business news
-        - Brokerage Research - Institutional equity research and forecasts
-        - SEBI Filings - Official regulatory disclosures
-        
-        Secondary Sources:
-        - MCA (Ministry of Corporate Affairs) - Company regulatory filings
-        - RBI Publications - Macroeconomic data and policy indicators
-        - NSE Research - Technical analysis and trading data
-        """)
-        
-        render_divider()
-        
-        st.markdown("**6. DATA QUALITY & LIMITATIONS**")
-        st.markdown("""
-        Data Quality Assurance:
-        - All data sourced from official government and exchange databases
-        - Cross-verified against multiple sources where applicable
-        - Annual figures audited and officially published
-        - Quarterly data from official stock exchange filings
-        
-        Known Limitations:
-        - FY2025 is year-to-date; final annual figures may differ
-        - Quarterly data represents 9-month snapshot (Q1-Q3)
-        - Sector classifications based on NSE standard definitions
-        - Analyst estimates subject to revision and consensus changes
-        - Margin calculations based on consolidated financial statements
-        
-        Data Currency:
-        - Last Updated: February 2025
-        - Update Frequency: Monthly during fiscal year
-        - Historical data: FY2021 onwards
-        """)
-        
-        render_divider()
-        
-        st.markdown("**7. METRIC DEFINITIONS**")
-        st.markdown("""
-        Growth Rates (Year-on-Year):
-        - Revenue Growth % = (Current Year Revenue - Prior Year Revenue) / Prior Year Revenue * 100
-        - Profit Growth % = (Current Year PAT - Prior Year PAT) / Prior Year PAT * 100
-        - EBITDA Growth % = (Current Year EBITDA - Prior Year EBITDA) / Prior Year EBITDA * 100
-        
-        Margins (Percentage of Revenue):
-        - EBITDA Margin % = (EBITDA / Revenue) * 100
-        - PAT Margin % = (PAT / Revenue) * 100
-        
-        Index Weight:
-        - Weight in Nifty % = (Sector Market Cap / Total Nifty 50 Market Cap) * 100
-        
-        Earnings Estimates:
-        - FY25 Profit Growth % = Consensus analyst estimate for FY25 PAT growth rate
-        """)
-        
-        render_divider()
-        
-        st.markdown("**8. DISCLAIMERS & IMPORTANT NOTES**")
-        st.markdown("""
-        - This dashboard presents historical and current data for informational purposes only
-        - Projections and estimates are subject to market volatility and unforeseen events
-        - Past performance does not guarantee future results
-        - Data is compiled from publicly available sources; accuracy not guaranteed
-        - For investment decisions, consult with qualified financial advisors
-        - All data presented as of February 2025; check sources for latest updates
-        - Quarterly estimates are preliminary; subject to revision with final results
-        """)
+        st.markdown(_data_notes_md())
     
     with tab6:
         render_subsection_header("📥 Download All Datasets")
@@ -1592,100 +1422,42 @@ elif page_index == 7:
         sectors_df = data['sector']
         downgrades_df = data['downgrades']
         
-        # Convert to CSV
-        five_year_csv = five_year_df.to_csv(index=False)
-        quarterly_csv = quarterly_df.to_csv(index=False)
-        sectors_csv = sectors_df.to_csv(index=False)
-        downgrades_csv = downgrades_df.to_csv(index=False)
-        
-        # Download buttons in columns
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**📈 5-Year Performance Data**")
-            st.markdown(f"*Records: {len(five_year_df)} | Metrics: {len(five_year_df.columns)}*")
-            st.download_button(
-                label="📥 Download 5-Year Data (CSV)",
-                data=five_year_csv,
-                file_name="nifty50_5year_performance.csv",
-                mime="text/csv",
-                key="download_5year"
-            )
-        
-        with col2:
-            st.markdown("**📊 Quarterly Performance Data**")
-            st.markdown(f"*Records: {len(quarterly_df)} | Metrics: {len(quarterly_df.columns)}*")
-            st.download_button(
-                label="📥 Download Quarterly Data (CSV)",
-                data=quarterly_csv,
-                file_name="nifty50_quarterly_performance.csv",
-                mime="text/csv",
-                key="download_quarterly"
-            )
-        
-        st.markdown("---")
+        data_summary = build_data_summary(five_year_df, quarterly_df, sectors_df, downgrades_df)
         
-        col3, col4 = st.columns(2)
+        downloads = [
+            (five_year_df, "5-Year Data", "nifty50_5year_performance.csv", "download_5year"),
+            (quarterly_df, "Quarterly Data", "nifty50_quarterly_performance.csv", "download_quarterly"),
+            (sectors_df, "Sector Data", "nifty50_sector_analysis.csv", "download_sectors"),
+            (downgrades_df, "Earnings Revisions", "nifty50_earnings_revisions.csv", "download_downgrades"),
+        ]
         
-        with col3:
-            st.markdown("**🏢 Sector Analysis Data**")
-            st.markdown(f"*Records: {len(sectors_df)} | Metrics: {len(sectors_df.columns)}*")
-            st.download_button(
-                label="📥 Download Sector Data (CSV)",
-                data=sectors_csv,
-                file_name="nifty50_sector_analysis.csv",
-                mime="text/csv",
-                key="download_sectors"
-            )
+        # One two-column grid for all download cards
+        cols = st.columns(2)
         
-        with col4:
-            st.markdown("**📉 Earnings Revisions Data**")
-            st.markdown(f"*Records: {len(downgrades_df)} | Metrics: {len(downgrades_df.columns)}*")
-            st.download_button(
-                label="📥 Download Earnings Revisions (CSV)",
-                data=downgrades_csv,
-                file_name="nifty50_earnings_revisions.csv",
-                mime="text/csv",
-                key="download_downgrades"
-            )
+        for i, (df, label, file_name, key) in enumerate(downloads):
+            with cols[i % 2]:
+                st.markdown(data_summary[i])
+                st.download_button(
+                    label=f"📥 Download {label} (CSV)",
+                    data=csv_bytes(df),
+                    file_name=file_name,
+                    mime="text/csv",
+                    key=key
+                )
         
         st.markdown("---")
         
         render_subsection_header("📦 Combined Download")
         
         st.markdown("""
-        **Download all datasets combined into a single CSV file**
+        **Download all datasets bundled into a single ZIP archive**
         """)
         
-        # Create combined dataset
-        combined_data = {
-            'Dataset Type': [],
-            'Data': []
-        }
-        
-        all_datasets = {
-            '5-Year Performance': five_year_df,
-            'Quarterly Performance': quarterly_df,
-            'Sector Analysis': sectors_df,
-            'Earnings Revisions': downgrades_df
-        }
-        
-        combined_text = "=== NIFTY 50 ANALYSIS DASHBOARD - COMPLETE DATA EXPORT ===\n"
-        combined_text += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        combined_text += "=" * 70 + "\n\n"
-        
-        for dataset_name, df in all_datasets.items():
-            combined_text += f"\n{'='*70}\n"
-            combined_text += f"{dataset_name.upper()}\n"
-            combined_text += f"{'='*70}\n"
-            combined_text += df.to_csv(index=False)
-            combined_text += "\n"
-        
         st.download_button(
-            label="📥 Download All Data Combined (TXT)",
-            data=combined_text,
-            file_name="nifty50_complete_analysis_export.txt",
-            mime="text/plain",
+            label="📥 Download All Data (ZIP)",
+            data=bundle_zip(five_year_df, quarterly_df, sectors_df, downgrades_df),
+            file_name="nifty50_all_datasets.zip",
+            mime="application/zip",
             key="download_combined"
         )
         
@@ -1696,7 +1468,7 @@ elif page_index == 7:
         st.markdown("""
         **Available Formats:**
         - Individual datasets: CSV format (recommended for data analysis tools)
-        - Combined export: TXT format (for quick reference)
+        - Combined export: ZIP archive of all four CSV files
         
         **Files Include:**
         - All historical performance data
@@ -1716,12 +1488,29 @@ elif page_index == 7:
         - `nifty50_quarterly_performance.csv` - Quarterly FY2025 data
         - `nifty50_sector_analysis.csv` - Top 10 sector contribution
         - `nifty50_earnings_revisions.csv` - 6-month analyst revisions
-        - `nifty50_complete_analysis_export.txt` - All data combined
+        - `nifty50_all_datasets.zip` - All four CSV files combined
         """)
 
+# ═══════════════════════════════════════════════════════════════════════════
+# PAGE DISPATCH
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Handlers in the same order as config.PAGES
+PAGE_HANDLERS: Dict[str, Callable[[dict], None]] = dict(zip(PAGES, (
+    _about,
+    _overview,
+    _five_year_trend,
+    _quarterly_deep_dive,
+    _sector_analysis,
+    _earnings_downgrades,
+    _scenarios,
+    _data_explorer,
+)))
+
+PAGE_HANDLERS.get(page, _about)(data)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # FOOTER
 # ═══════════════════════════════════════════════════════════════════════════
 
-st.markdown("---")
 render_footer(AUTHOR, BRAND_NAME, "NSE, RBI, BSE, MCA, SEBI | Research: Business Standard, Economic Times, Brokerages")
@@ -6,21 +6,86 @@ Provides reusable UI components and styling functions
 consistent with Mountain Path - World of Finance design system.
 """
 
+import functools
+import html
+
 try:
     import streamlit as st
 except ImportError:
     st = None
 
-from config import COLORS, FONTS
+from config import COLORS, FONTS, MAX_STYLED_ROWS
+
+# Footer copyright line (styled by the .copyright class)
+COPYRIGHT_HTML = (
+    "<p class='copyright'>"
+    "<i>© 2026 The Mountain Path - World of Finance | All Rights Reserved</i>"
+    "</p>"
+)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HTML TEMPLATES
+# ═══════════════════════════════════════════════════════════════════════════
+# Styling comes from classes in get_custom_css(); the render functions only
+# fill in the per-call fields with str.format, escaping caller text first.
+
+_SECTION_HEADER_TMPL = '<div class="section-header"><h2>{text}</h2></div>'
+
+_SUBSECTION_HEADER_TMPL = "#### {text}"
+
+_SIDEBAR_METRIC_TMPL = (
+    "<p><strong>{label}</strong></p>"
+    "<div class='metric-value'>{value}</div>"
+    "<p><span class='metric-label'>{note}</span></p>"
+)
+
+_ALERT_TMPL = "**{title}**\n\n{content}"
+
+_METRIC_DELTA_TMPL = '<span class="metric-delta {tone}">{delta}</span>'
+_METRIC_CARD_TMPL = """
+    <div class="metric-card">
+        <div class="metric-label">{label}</div>
+        <div class="metric-value">{value}</div>
+        {delta_html}
+    </div>
+    """
+
+_FOOTER_TMPL = (
+    '<div class="subtle-divider"></div>'
+    '<div class="footer-grid">'
+    '<span><b>Author:</b> {author}</span>'
+    '<span><b>Platform:</b> {brand}</span>'
+    '<span><b>Sources:</b> {sources}</span>'
+    '</div>'
+)
+
+# Vertical spacers: .vspace-1 ... .vspace-N are defined in get_custom_css()
+_VSPACE_MAX = 5
+_VSPACE_TMPL = '<div class="vspace-{lines}"></div>'
+# Spacer payloads are pre-built so spacing() never formats a string
+_VSPACE_HTML = tuple(_VSPACE_TMPL.format(lines=n) for n in range(_VSPACE_MAX + 1))
+_VSPACE_CSS = "\n".join(
+    f"    .vspace-{n} {{ height: {n}rem; }}" for n in range(1, _VSPACE_MAX + 1)
+)
+
+_DIVIDER = "---"
+
+_METRIC_GRID_TMPL = '<div class="metric-grid">{cards}</div>'
+
+_COMPARISON_BOX_TMPL = '<div class="info-box"><b>{title}</b><br>{items}</div>'
+_COMPARISON_ITEM_TMPL = "{label}: <b>{value}</b><br>"
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CSS STYLING
 # ═══════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=1)
 def get_custom_css():
     """
     Returns custom CSS for the application.
     Applies Mountain Path design system.
+    
+    Built once per process; COLORS and FONTS are constants.
     """
     css = f"""
     <style>
@@ -155,6 +220,50 @@ def get_custom_css():
         font-size: 0.875rem;
         font-weight: 600;
         margin-top: 0.5rem;
+        color: {COLORS['text_muted']};
+    }}
+
+    .metric-grid {{
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+        gap: 1rem;
+    }}
+
+    .metric-delta.green {{
+        color: {COLORS['accent_green']};
+    }}
+
+    .metric-delta.red {{
+        color: {COLORS['accent_red']};
+    }}
+
+    /* Section header (contrast background) */
+    .section-header {{
+        background-color: {COLORS['dark_blue']};
+        color: #FFFFFF;
+        padding: 20px;
+        border-radius: 10px;
+        margin-bottom: 20px;
+    }}
+
+    .section-header h2 {{
+        margin: 0;
+        font-size: 28px;
+        font-weight: 700;
+    }}
+
+    /* Footer */
+    .footer-grid {{
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+    }}
+
+    .copyright {{
+        text-align: center;
+        color: {COLORS['text_muted']};
+        font-size: 0.85rem;
+        margin-top: 2rem;
     }}
 
     /* Sidebar */
@@ -224,6 +333,95 @@ def get_custom_css():
         box-shadow: 0 4px 12px rgba(0, 51, 102, 0.2);
     }}
 
+    /* Sidebar Radio Buttons - Contrast Background */
+    /* Sidebar container background */
+    section[data-testid="stSidebar"] {{
+        background-color: #F5F5F5 !important;
+    }}
+
+    /* Radio button group container */
+    section[data-testid="stSidebar"] [role="radiogroup"] {{
+        display: flex !important;
+        flex-direction: column !important;
+        gap: 8px !important;
+    }}
+
+    /* Individual radio button styling */
+    section[data-testid="stSidebar"] [role="radio"] {{
+        background-color: #FFFFFF !important;
+        border: 2px solid #003366 !important;
+        border-radius: 8px !important;
+        padding: 12px 14px !important;
+        margin: 4px 0 !important;
+        font-weight: 600 !important;
+        color: #003366 !important;
+        cursor: pointer !important;
+        transition: all 0.3s ease !important;
+        display: flex !important;
+        align-items: center !important;
+    }}
+
+    /* Hover state - light blue background */
+    section[data-testid="stSidebar"] [role="radio"]:hover {{
+        background-color: #F0F7FF !important;
+        border-color: #005599 !important;
+        box-shadow: 0 2px 6px rgba(0, 51, 102, 0.15) !important;
+    }}
+
+    /* Selected/Active radio button - dark blue background with white text */
+    section[data-testid="stSidebar"] [role="radio"][aria-checked="true"] {{
+        background: linear-gradient(135deg, #003366 0%, #005599 100%) !important;
+        color: #FFFFFF !important;
+        border-color: #003366 !important;
+        box-shadow: 0 4px 12px rgba(0, 51, 102, 0.25) !important;
+        font-weight: 700 !important;
+    }}
+
+    /* Radio circle styling */
+    section[data-testid="stSidebar"] input[type="radio"] {{
+        accent-color: #003366 !important;
+        cursor: pointer !important;
+    }}
+
+    /* Selected radio circle white */
+    section[data-testid="stSidebar"] [aria-checked="true"] input[type="radio"] {{
+        accent-color: #FFFFFF !important;
+    }}
+
+    /* Tabs (Data Explorer) */
+    .stTabs [data-baseweb="tab-list"] button {{
+        background-color: #E8EDEF !important;
+        border: 2px solid #003366 !important;
+        border-radius: 6px !important;
+        padding: 12px 20px !important;
+        margin-right: 10px !important;
+        font-weight: 600 !important;
+        color: #003366 !important;
+        font-size: 14px !important;
+    }}
+
+    .stTabs [data-baseweb="tab-list"] button:hover {{
+        background-color: #D0D8E8 !important;
+        border-color: #005599 !important;
+    }}
+
+    .stTabs [data-baseweb="tab-list"] [aria-selected="true"] {{
+        background-color: #003366 !important;
+        color: #FFFFFF !important;
+        border-color: #003366 !important;
+    }}
+
+    .stTabs [data-baseweb="tab-panel"] {{
+        padding: 20px !important;
+        background-color: #F8FAFB !important;
+        border-radius: 8px !important;
+        border-left: 5px solid #003366 !important;
+        margin-top: 20px !important;
+    }}
+
+    /* Vertical spacing */
+{_VSPACE_CSS}
+
     /* Responsive */
     @media (max-width: 768px) {{
         h1 {{
@@ -242,58 +440,62 @@ def get_custom_css():
 # COMPONENT RENDERING FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════
 
+def _ui(func):
+    """Turn a render function into a no-op when Streamlit is not installed"""
+    if st is not None:
+        return func
+    
+    @functools.wraps(func)
+    def _noop(*args, **kwargs):
+        return None
+    return _noop
+
+
+@_ui
 def render_main_title(title, subtitle):
     """Render main page title with subtitle"""
     st.markdown(f"# {title}")
     st.markdown(f"*{subtitle}*", unsafe_allow_html=True)
 
 
+@_ui
 def render_section_header(text):
     """Render section header with contrast background and color"""
-    if st is None:
-        return
-    # HTML with contrast background (dark blue) and white text
-    st.markdown(
-        f'<div style="background-color: #003366; color: #FFFFFF; padding: 20px; border-radius: 10px; margin-bottom: 20px;"><h2 style="margin: 0; font-size: 28px; font-weight: 700;">{text}</h2></div>',
-        unsafe_allow_html=True
-    )
+    # One element: contrast-background header; text is escaped, not trusted as HTML
+    st.html(_SECTION_HEADER_TMPL.format(text=html.escape(text)))
 
 
+@_ui
 def render_subsection_header(text):
     """Render subsection header"""
-    if st is None:
-        return
-    st.markdown(f"#### {text}")
+    st.markdown(_SUBSECTION_HEADER_TMPL.format(text=text))
 
 
+@_ui
 def render_info_box(content):
     """Render info box using st.info with markdown support"""
-    if st is None:
-        return
     st.info(content)
 
 
+@_ui
 def render_warning_box(content):
     """Render warning box using st.warning with markdown support"""
-    if st is None:
-        return
     st.warning(content)
 
 
+@_ui
 def render_success_box(content):
     """Render success box using st.success with markdown support"""
-    if st is None:
-        return
     st.success(content)
 
 
+@_ui
 def render_divider():
     """Render subtle divider line"""
-    if st is None:
-        return
-    st.markdown("---")
+    st.markdown(_DIVIDER)
 
 
+@_ui
 def display_styled_dataframe(df, columns_to_style=None, width='stretch', hide_index=True):
     """
     Display DataFrame with optional styling and full width support.
@@ -304,10 +506,15 @@ def display_styled_dataframe(df, columns_to_style=None, width='stretch', hide_in
         width: Column width ('stretch' or 'content')
         hide_index: Hide row index
     """
-    if st is None:
-        return
-    
     try:
+        if columns_to_style:
+            styled_df = df.head(MAX_STYLED_ROWS)
+            table_html = _gradient_table_html(styled_df, tuple(columns_to_style), hide_index)
+            if table_html:
+                st.markdown(table_html, unsafe_allow_html=True)
+                if len(df) > MAX_STYLED_ROWS:
+                    st.caption(f"Styled preview limited to {MAX_STYLED_ROWS:,} rows of {len(df):,}")
+                return
         # Convert width parameter to use_container_width for st.dataframe
         use_width = (width == 'stretch')
         st.dataframe(df, use_container_width=use_width, hide_index=hide_index)
@@ -315,6 +522,34 @@ def display_styled_dataframe(df, columns_to_style=None, width='stretch', hide_in
         st.warning(f"Could not display dataframe: {str(e)}")
 
 
+def _cache_resource(func):
+    """Memoize with st.cache_resource when Streamlit is available"""
+    if st is None:
+        return func
+    return st.cache_resource(show_spinner=False)(func)
+
+
+@_cache_resource
+def _gradient_table_html(df, columns, hide_index=True):
+    """
+    Render df as a static HTML table with an RdYlGn gradient on the
+    numeric columns in `columns`.
+    
+    Cached per (DataFrame, columns, hide_index) so neither the Styler nor
+    its HTML is rebuilt on reruns. Returns None when none of the columns
+    are numeric, leaving the caller to fall back to st.dataframe.
+    """
+    numeric = set(df.select_dtypes('number').columns)
+    subset = [col for col in columns if col in numeric]
+    if not subset:
+        return None
+    styler = df.style.background_gradient(subset=subset, cmap='RdYlGn').format(precision=1)
+    if hide_index:
+        styler = styler.hide(axis='index')
+    return styler.to_html()
+
+
+@_ui
 def render_footer(author, brand, sources):
     """
     Render page footer with author, brand, and sources.
@@ -324,29 +559,18 @@ def render_footer(author, brand, sources):
         brand (str): Brand name
         sources (str): Data sources
     """
-    if st is None:
-        return
-    st.markdown("---")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"**Author:** {author}")
-    
-    with col2:
-        st.markdown(f"**Platform:** {brand}")
-    
-    with col3:
-        st.markdown(f"**Sources:** {sources}")
-    
-    st.markdown(
-        f"<p style='text-align:center; color:{COLORS['text_muted']}; "
-        f"font-size:0.85rem; margin-top:2rem;'>"
-        f"<i>© 2026 The Mountain Path - World of Finance | All Rights Reserved</i>"
-        f"</p>",
-        unsafe_allow_html=True
-    )
+    st.html(_footer_html(author, brand, sources))
 
 
+@functools.lru_cache(maxsize=None)
+def _footer_html(author, brand, sources):
+    """Build the footer divider, grid and copyright once per distinct (author, brand, sources)"""
+    return _FOOTER_TMPL.format(
+        author=html.escape(author), brand=html.escape(brand), sources=html.escape(sources)
+    ) + COPYRIGHT_HTML
+
+
+@_ui
 def render_sidebar_metrics(metrics_dict):
     """
     Render metrics in sidebar with consistent styling.
@@ -354,19 +578,16 @@ def render_sidebar_metrics(metrics_dict):
     Args:
         metrics_dict (dict): Dictionary of {label: (value, note)}
     """
-    for label, (value, note) in metrics_dict.items():
-        st.sidebar.markdown(f"**{label}**")
-        st.sidebar.markdown(
-            f"<div class='metric-value'>{value}</div>",
-            unsafe_allow_html=True
+    # One sidebar element for all metrics instead of four per metric
+    st.sidebar.html("".join(
+        _SIDEBAR_METRIC_TMPL.format(
+            label=html.escape(label), value=html.escape(str(value)), note=html.escape(note)
         )
-        st.sidebar.markdown(
-            f"<span class='metric-label'>{note}</span>",
-            unsafe_allow_html=True
-        )
-        st.sidebar.markdown("")
+        for label, (value, note) in metrics_dict.items()
+    ))
 
 
+@_ui
 def render_sidebar_alert(title, content, alert_type="warning"):
     """
     Render alert box in sidebar.
@@ -376,20 +597,27 @@ def render_sidebar_alert(title, content, alert_type="warning"):
         content (str): Alert content
         alert_type (str): Type - 'warning', 'error', or 'info'
     """
+    message = _ALERT_TMPL.format(title=title, content=content)
     if alert_type == "warning":
-        st.sidebar.warning(f"**{title}**\n\n{content}")
+        st.sidebar.warning(message)
     elif alert_type == "error":
-        st.sidebar.error(f"**{title}**\n\n{content}")
+        st.sidebar.error(message)
     else:
-        st.sidebar.info(f"**{title}**\n\n{content}")
+        st.sidebar.info(message)
 
 
+@_ui
 def spacing(lines=1):
-    """Add vertical spacing between elements"""
-    for _ in range(lines):
-        st.markdown("")
+    """Add vertical spacing between elements (one element, `lines` rem high)"""
+    if lines <= 0:
+        return
+    if lines <= _VSPACE_MAX:
+        st.html(_VSPACE_HTML[lines])
+    else:
+        st.html(f'<div style="height: {lines}rem;"></div>')
 
 
+@_ui
 def render_metric_card(label, value, delta=None, delta_color=None):
     """
     Render a metric card with label and value.
@@ -402,24 +630,39 @@ def render_metric_card(label, value, delta=None, delta_color=None):
     """
     delta_html = ""
     if delta:
-        color_map = {
-            'green': COLORS['accent_green'],
-            'red': COLORS['accent_red'],
-            'neutral': COLORS['text_muted']
-        }
-        color = color_map.get(delta_color, COLORS['text_muted'])
-        delta_html = f'<span class="metric-delta" style="color:{color};">{delta}</span>'
+        # .metric-delta.green / .red; anything else renders muted
+        tone = delta_color if delta_color in ('green', 'red') else 'neutral'
+        delta_html = _METRIC_DELTA_TMPL.format(tone=tone, delta=html.escape(delta))
     
-    html = f"""
-    <div class="metric-card">
-        <div class="metric-label">{label}</div>
-        <div class="metric-value">{value}</div>
-        {delta_html}
-    </div>
+    st.html(_METRIC_CARD_TMPL.format(
+        label=html.escape(label), value=html.escape(str(value)), delta_html=delta_html
+    ))
+
+
+@_ui
+def render_metric_grid(metrics, delta_color='green'):
+    """
+    Render a strip of metric cards as a single HTML grid.
+    
+    Args:
+        metrics (dict): Dictionary of {label: (value, delta)}; delta may be None
+        delta_color (str): Color for all deltas - 'green', 'red', or 'neutral'
     """
-    st.markdown(html, unsafe_allow_html=True)
+    tone = delta_color if delta_color in ('green', 'red') else 'neutral'
+    cards = "".join(
+        _METRIC_CARD_TMPL.format(
+            label=html.escape(label),
+            value=html.escape(str(value)),
+            delta_html=(
+                _METRIC_DELTA_TMPL.format(tone=tone, delta=html.escape(delta)) if delta else ""
+            )
+        )
+        for label, (value, delta) in metrics.items()
+    )
+    st.html(_METRIC_GRID_TMPL.format(cards=cards))
 
 
+@_ui
 def render_comparison_box(title, items):
     """
     Render a comparison box with multiple items.
@@ -428,13 +671,22 @@ def render_comparison_box(title, items):
         title (str): Box title
         items (dict): Dictionary of {label: value}
     """
-    html = f"<b>{title}</b><br>"
-    for label, value in items.items():
-        html += f"{label}: <b>{value}</b><br>"
+    rows = "".join(
+        _COMPARISON_ITEM_TMPL.format(label=html.escape(label), value=html.escape(str(value)))
+        for label, value in items.items()
+    )
     
-    render_info_box(html)
+    # Styled by .info-box; st.info would show the <b>/<br> tags as text
+    st.html(_COMPARISON_BOX_TMPL.format(title=html.escape(title), items=rows))
 
 
+@_ui
 def apply_custom_css():
-    """Apply custom CSS to Streamlit app"""
+    """
+    Apply custom CSS to Streamlit app.
+    
+    Must run on every rerun: Streamlit drops any element a rerun does
+    not re-emit, so the style tag cannot be gated per session. The CSS
+    string itself comes from the process-wide cache.
+    """
     st.markdown(get_custom_css(), unsafe_allow_html=True)